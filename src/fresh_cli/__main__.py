@@ -1,13 +1,63 @@
 """Freshservice CLI - A command-line tool for managing Freshservice tickets."""
 
+import shutil
+import sys
+from typing import TYPE_CHECKING
+
 import click
-from .api import FreshserviceClient
 from .config import Config
 
+if TYPE_CHECKING:
+    from .api import FreshserviceClient
+
+STATUS_NAME = {2: "Open", 3: "Pending", 4: "Resolved", 5: "Closed"}
+PRIORITY_NAME = {1: "Low", 2: "Medium", 3: "High", 4: "Urgent"}
+CLI_STATUS_TO_ID = {"open": 2, "pending": 3, "resolved": 4, "closed": 5}
+STATUS_CHOICES = click.Choice([*CLI_STATUS_TO_ID])
+
+LIST_HEADER = "ID         Subject                                    Status       Priority   "
+LIST_DIVIDER = "-" * 72
+
+
+def _status_to_id(ctx: click.Context, param: click.Parameter, value: str | None) -> int | None:
+    """Convert a validated status choice to its Freshservice status ID."""
+    return None if value is None else CLI_STATUS_TO_ID[value]
+
+
+def _status_name(status: int | None) -> str:
+    """Display name for a status ID, or "-" when the ticket has none."""
+    if status is None:
+        return "-"
+    return STATUS_NAME.get(status, str(status))
+
+
+def _priority_name(priority: int | None) -> str:
+    """Display name for a priority level, or "-" when the ticket has none."""
+    if priority is None:
+        return "-"
+    return PRIORITY_NAME.get(priority, str(priority))
+
+
+def _truncate_subject(subject: str | None) -> str:
+    """Shorten a subject to fit the 40-character list column."""
+    if not subject:
+        return ""
+    return subject[:37] + "..." if len(subject) > 40 else subject
+
 
 @click.group()
-@click.option("--api-key", envvar="FRESHSERVICE_API_KEY", help="Your Freshservice API key")
-@click.option("--domain", envvar="FRESHSERVICE_DOMAIN", default="freshservice.com", help="Freshservice domain")
+@click.option(
+    "--api-key",
+    envvar="FRESHSERVICE_API_KEY",
+    default=lambda: Config().api_key,
+    help="Your Freshservice API key",
+)
+@click.option(
+    "--domain",
+    envvar="FRESHSERVICE_DOMAIN",
+    default=lambda: Config().domain,
+    help="Freshservice domain",
+)
 @click.pass_context
 def cli(ctx: click.Context, api_key: str, domain: str) -> None:
     """Freshservice CLI - Manage your Freshservice tickets from the command line."""
@@ -17,56 +67,61 @@ def cli(ctx: click.Context, api_key: str, domain: str) -> None:
             "or use the --api-key option."
         )
 
-    ctx.obj = {
-        "client": FreshserviceClient(api_key=api_key, domain=domain),
-        "config": Config(),
-    }
+    from .api import FreshserviceClient
+
+    client = FreshserviceClient(api_key=api_key, domain=domain)
+    ctx.call_on_close(client.close)
+
+    ctx.obj = {"client": client}
 
 
 @cli.command()
-@click.option("--status", type=click.Choice(["open", "pending", "resolved", "closed"]), help="Filter by status")
+@click.option("--status", type=STATUS_CHOICES, callback=_status_to_id, help="Filter by status")
 @click.option("--priority", type=click.IntRange(1, 4), help="Filter by priority (1-4)")
-@click.option("--limit", default=20, help="Maximum number of tickets to show")
+@click.option(
+    "--limit", default=20, type=click.IntRange(min=1), help="Maximum number of tickets to show"
+)
+@click.option(
+    "--order-type",
+    type=click.Choice(["asc", "desc"]),
+    help="Sort by creation time, ascending or descending (not with --status/--priority)",
+)
 @click.pass_context
-def list(ctx: click.Context, status: str | None, priority: int | None, limit: int) -> None:
+def list(
+    ctx: click.Context,
+    status: int | None,
+    priority: int | None,
+    limit: int,
+    order_type: str | None,
+) -> None:
     """List tickets."""
     client: FreshserviceClient = ctx.obj["client"]
 
     filters = {}
     if status:
-        status_map = {
-            "open": 2,
-            "pending": 3,
-            "resolved": 4,
-            "closed": 5,
-        }
-        filters["status"] = status_map[status]
+        filters["status"] = status
     if priority:
         filters["priority"] = priority
+    if filters and order_type:
+        raise click.UsageError("--order-type cannot be combined with --status or --priority.")
 
-    tickets = client.list_tickets(filters=filters, limit=limit)
+    tickets = client.list_tickets_summary(filters=filters, limit=limit, order_type=order_type)
 
     if not tickets:
         click.echo("No tickets found.")
         return
 
-    click.echo("ID         Subject                                    Status       Priority   ")
-    click.echo("-" * 72)
-
-    for ticket in tickets:
-        status_display = {
-            2: "Open",
-            3: "Pending",
-            4: "Resolved",
-            5: "Closed",
-        }.get(ticket.status, str(ticket.status))
-
-        priority_display = {1: "Low", 2: "Medium", 3: "High", 4: "Urgent"}.get(
-            ticket.priority, str(ticket.priority)
-        )
-
-        subject = ticket.subject[:37] + "..." if len(ticket.subject) > 40 else ticket.subject
-        click.echo(f"{ticket.id:<10} {subject:<40} {status_display:<12} {priority_display:<10}")
+    rows = [
+        f"{t.id:<10} {_truncate_subject(t.subject):<40} "
+        f"{_status_name(t.status):<12} "
+        f"{_priority_name(t.priority):<10}"
+        for t in tickets
+    ]
+    output = "\n".join([LIST_HEADER, LIST_DIVIDER, *rows])
+    if sys.stdout.isatty() and len(rows) + 2 > shutil.get_terminal_size().lines:
+        click.echo_via_pager(output)
+    else:
+        sys.stdout.write(output + "\n")
 
 
 @cli.command()
@@ -81,52 +136,65 @@ def view(ctx: click.Context, ticket_id: int) -> None:
     except Exception as e:
         raise click.ClickException(f"Failed to retrieve ticket: {e}")
 
-    status_map = {
-        2: "Open",
-        3: "Pending",
-        4: "Resolved",
-        5: "Closed",
-    }
-
-    priority_map = {1: "Low", 2: "Medium", 3: "High", 4: "Urgent"}
-
-    click.echo(f"Ticket #{ticket.id}")
-    click.echo("=" * 60)
-    click.echo(f"Subject: {ticket.subject}")
-    click.echo("Description:")
-    click.echo(ticket.description)
-    click.echo()
-    click.echo("Details:")
-    click.echo(f"  Status:    {status_map.get(ticket.status, ticket.status)}")
-    click.echo(f"  Priority:  {priority_map.get(ticket.priority, ticket.priority)}")
-    click.echo(f"  Created:   {ticket.created_at}")
-    click.echo(f"  Updated:   {ticket.updated_at}")
-    click.echo(f"  Requester: {ticket.requester_id}")
     assignee = ticket.responder_id if ticket.responder_id else "Unassigned"
-    click.echo(f"  Assignee:  {assignee}")
+    requester = ticket.requester_id if ticket.requester_id is not None else "-"
+    lines = [
+        f"Ticket #{ticket.id}",
+        "=" * 60,
+        f"Subject: {ticket.subject or ''}",
+        "Description:",
+        ticket.description or "",
+        "",
+        "Details:",
+        f"  Status:    {_status_name(ticket.status)}",
+        f"  Priority:  {_priority_name(ticket.priority)}",
+        f"  Created:   {ticket.created_at or '-'}",
+        f"  Updated:   {ticket.updated_at or '-'}",
+        f"  Requester: {requester}",
+        f"  Assignee:  {assignee}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 @cli.command()
 @click.argument("ticket_id", type=int)
-@click.argument("status", type=click.Choice(["open", "pending", "resolved", "closed"]))
+@click.argument("status", type=STATUS_CHOICES, callback=_status_to_id)
 @click.pass_context
-def status(ctx: click.Context, ticket_id: int, status: str) -> None:
+def status(ctx: click.Context, ticket_id: int, status: int) -> None:
     """Update ticket status."""
     client: FreshserviceClient = ctx.obj["client"]
 
-    status_map = {
-        "open": 2,
-        "pending": 3,
-        "resolved": 4,
-        "closed": 5,
-    }
-
     try:
-        client.update_ticket_status(ticket_id, status_map[status])
-        click.echo(f"Ticket #{ticket_id} status updated to {status}.")
+        client.update_ticket_status(ticket_id, status)
+        click.echo(f"Ticket #{ticket_id} status updated to {STATUS_NAME[status].lower()}.")
     except Exception as e:
         raise click.ClickException(f"Failed to update ticket status: {e}")
 
 
+@cli.command("status-batch")
+@click.argument("status", type=STATUS_CHOICES, callback=_status_to_id)
+@click.argument("ticket_ids", type=int, nargs=-1, required=True)
+@click.pass_context
+def status_batch(ctx: click.Context, status: int, ticket_ids: tuple[int, ...]) -> None:
+    """Update the status of several tickets at once."""
+    import asyncio
+
+    client: FreshserviceClient = ctx.obj["client"]
+
+    updates = [(ticket_id, status) for ticket_id in ticket_ids]
+    errors = asyncio.run(client.update_ticket_statuses(updates))
+
+    failed = 0
+    for ticket_id, error in zip(ticket_ids, errors):
+        if error is None:
+            click.echo(f"Ticket #{ticket_id} status updated to {STATUS_NAME[status].lower()}.")
+        else:
+            failed += 1
+            click.echo(f"Failed to update ticket #{ticket_id}: {error}", err=True)
+
+    if failed:
+        raise click.ClickException(f"{failed} of {len(ticket_ids)} ticket updates failed.")
+
+
 if __name__ == "__main__":
     cli()
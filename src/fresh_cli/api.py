@@ -1,49 +1,108 @@
 """Freshservice API client for interacting with the Freshservice API."""
 
-from httpx import Client
+import asyncio
+
+import msgspec
+from httpx import AsyncClient, Client, Limits, Response
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterator, Optional, TypeVar
 
 
-class Ticket:
-    """Represents a Freshservice ticket."""
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp from the API, returning None when missing or empty.
 
-    def __init__(
-        self,
-        id: int,
-        subject: str,
-        description: str,
-        status: int,
-        priority: int,
-        created_at: str,
-        updated_at: str,
-        requester_id: int,
-        responder_id: Optional[int] = None,
-    ):
-        self.id = id
-        self.subject = subject
-        self.description = description
-        self.status = status
-        self.priority = priority
-        self.created_at = created_at
-        self.updated_at = updated_at
-        self.requester_id = requester_id
-        self.responder_id = responder_id
+    Results are cached process-wide by timestamp string. Malformed values
+    raise ValueError.
+    """
+    return datetime.fromisoformat(value) if value else None
+
+
+_MAX_CONNECTIONS = 20
+_LIMITS = Limits(
+    max_connections=_MAX_CONNECTIONS, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+
+# Attempts per request in update_ticket_statuses before a 429 is reported as a failure.
+_RATE_LIMIT_ATTEMPTS = 3
+
+
+def _retry_delay(response: Response, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited request."""
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return 2.0**attempt
+
+
+class Ticket(msgspec.Struct, frozen=True):
+    """Represents a Freshservice ticket.
+
+    Fields other than id are None when the API omits them or sends null.
+    """
+
+    id: int
+    subject: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[int] = None
+    priority: Optional[int] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    requester_id: Optional[int] = None
+    responder_id: Optional[int] = None
+
+    @property
+    def created(self) -> Optional[datetime]:
+        """created_at parsed as a datetime, or None if it is missing."""
+        return _parse_timestamp(self.created_at)
+
+    @property
+    def updated(self) -> Optional[datetime]:
+        """updated_at parsed as a datetime, or None if it is missing."""
+        return _parse_timestamp(self.updated_at)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Ticket":
         """Create a Ticket instance from API response data."""
-        return cls(
-            id=data["id"],
-            subject=data.get("subject", ""),
-            description=data.get("description", ""),
-            status=data.get("status", 0),
-            priority=data.get("priority", 0),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-            requester_id=data.get("requester_id", 0),
-            responder_id=data.get("responder_id"),
-        )
+        return msgspec.convert(data, cls)
+
+
+class TicketSummary(msgspec.Struct, frozen=True):
+    """Lightweight view of a ticket holding only the fields shown in listings."""
+
+    id: int
+    subject: Optional[str] = None
+    status: Optional[int] = None
+    priority: Optional[int] = None
+
+
+class _TicketPage(msgspec.Struct):
+    tickets: list[Ticket] = msgspec.field(default_factory=list)
+
+
+class _TicketSummaryPage(msgspec.Struct):
+    tickets: list[TicketSummary] = msgspec.field(default_factory=list)
+
+
+class _TicketEnvelope(msgspec.Struct):
+    ticket: Ticket
+
+
+_TICKET_PAGE_DECODER = msgspec.json.Decoder(_TicketPage)
+_TICKET_SUMMARY_PAGE_DECODER = msgspec.json.Decoder(_TicketSummaryPage)
+_TICKET_DECODER = msgspec.json.Decoder(_TicketEnvelope)
+
+_T = TypeVar("_T")
+
+
+def _decode_ticket_page(content: bytes) -> list[Ticket]:
+    return _TICKET_PAGE_DECODER.decode(content).tickets
+
+
+def _decode_ticket_summary_page(content: bytes) -> list[TicketSummary]:
+    return _TICKET_SUMMARY_PAGE_DECODER.decode(content).tickets
 
 
 class FreshserviceClient:
@@ -59,14 +118,33 @@ class FreshserviceClient:
         """
         self.api_key = api_key
         self.base_url = f"https://{domain}/api/v2"
-        self.client = Client(
-            auth=(api_key, "X"),
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
+        self.client = Client(**self._client_options())
+
+    def _client_options(self) -> dict:
+        """Keyword arguments shared by the sync and async httpx clients."""
+        return {
+            "auth": (self.api_key, "X"),
+            "headers": {"Content-Type": "application/json"},
+            "timeout": 30.0,
+            "http2": True,
+            "limits": _LIMITS,
+        }
+
+    def __enter__(self) -> "FreshserviceClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self.client.close()
 
     def list_tickets(
-        self, filters: Optional[dict] = None, limit: int = 20
+        self,
+        filters: Optional[dict] = None,
+        limit: int = 20,
+        order_type: Optional[str] = None,
     ) -> list[Ticket]:
         """
         List tickets with optional filters.
@@ -74,23 +152,89 @@ class FreshserviceClient:
         Args:
             filters: Filter parameters (status, priority, etc.)
             limit: Maximum number of tickets to return
+            order_type: Sort direction by creation time, 'asc' or 'desc'
+                (unfiltered listings only)
 
         Returns:
             List of Ticket objects
         """
-        response = self.client.get(f"{self.base_url}/tickets")
-        response.raise_for_status()
+        tickets = self.iter_tickets(filters=filters, page_size=limit, order_type=order_type)
+        return list(islice(tickets, limit))
 
-        data = response.json()
-        tickets = [Ticket.from_dict(ticket) for ticket in data.get("tickets", [])]
+    def list_tickets_summary(
+        self,
+        filters: Optional[dict] = None,
+        limit: int = 20,
+        order_type: Optional[str] = None,
+    ) -> list[TicketSummary]:
+        """
+        List tickets with optional filters, keeping only the fields needed for display.
+
+        Args:
+            filters: Filter parameters (status, priority, etc.)
+            limit: Maximum number of tickets to return
+            order_type: Sort direction by creation time, 'asc' or 'desc'
+                (unfiltered listings only)
+
+        Returns:
+            List of TicketSummary objects
+        """
+        tickets = self._iter_ticket_pages(
+            _decode_ticket_summary_page, filters, limit, order_type
+        )
+        return list(islice(tickets, limit))
+
+    def iter_tickets(
+        self,
+        filters: Optional[dict] = None,
+        page_size: int = 100,
+        order_type: Optional[str] = None,
+    ) -> Iterator[Ticket]:
+        """
+        Iterate over tickets page by page, fetching the next page only when needed.
+
+        Args:
+            filters: Filter parameters (status, priority, etc.)
+            page_size: Number of tickets to request per page (capped at 100)
+            order_type: Sort direction by creation time, 'asc' or 'desc'
+                (unfiltered listings only)
+
+        Yields:
+            Ticket objects
+        """
+        yield from self._iter_ticket_pages(
+            _decode_ticket_page, filters, page_size, order_type
+        )
+
+    def _iter_ticket_pages(
+        self,
+        decode_page: Callable[[bytes], list[_T]],
+        filters: Optional[dict],
+        page_size: int,
+        order_type: Optional[str] = None,
+    ) -> Iterator[_T]:
+        """Yield tickets from each page via decode_page, following Link rel="next" headers."""
+        if filters and order_type:
+            raise ValueError("order_type is only supported for unfiltered ticket listings")
 
+        params: dict = {"page": 1, "per_page": min(page_size, 100)}
+        if order_type:
+            params["order_type"] = order_type
+        url = f"{self.base_url}/tickets"
         if filters:
-            if "status" in filters:
-                tickets = [t for t in tickets if t.status == filters["status"]]
-            if "priority" in filters:
-                tickets = [t for t in tickets if t.priority == filters["priority"]]
+            url = f"{self.base_url}/tickets/filter"
+            query = " AND ".join(f"{key}:{value}" for key, value in filters.items())
+            params["query"] = f'"{query}"'
+
+        while True:
+            response = self.client.get(url, params=params)
+            response.raise_for_status()
+
+            yield from decode_page(response.content)
 
-        return tickets[:limit]
+            if "next" not in response.links:
+                return
+            params["page"] += 1
 
     def get_ticket(self, ticket_id: int) -> Ticket:
         """
@@ -105,8 +249,7 @@ class FreshserviceClient:
         response = self.client.get(f"{self.base_url}/tickets/{ticket_id}")
         response.raise_for_status()
 
-        data = response.json()
-        return Ticket.from_dict(data["ticket"])
+        return _TICKET_DECODER.decode(response.content).ticket
 
     def update_ticket_status(self, ticket_id: int, status: int) -> None:
         """
@@ -117,5 +260,47 @@ class FreshserviceClient:
             status: New status value (2=Open, 3=Pending, 4=Resolved, 5=Closed)
         """
         payload = {"status": status}
-        response = self.client.put(f"{self.base_url}/tickets/{ticket_id}", json=payload)
+        response = self.client.put(
+            f"{self.base_url}/tickets/{ticket_id}", content=msgspec.json.encode(payload)
+        )
         response.raise_for_status()
+
+    async def update_ticket_statuses(
+        self, updates: list[tuple[int, int]]
+    ) -> list[Optional[BaseException]]:
+        """
+        Update the status of several tickets concurrently.
+
+        At most _MAX_CONNECTIONS requests are in flight at once, so large
+        batches queue here instead of timing out waiting for a pooled
+        connection. A 429 (rate limited) response is retried after its
+        Retry-After delay, up to _RATE_LIMIT_ATTEMPTS attempts per ticket.
+
+        Args:
+            updates: (ticket_id, status) pairs to apply
+
+        Returns:
+            One entry per update, in order: None on success, otherwise the raised exception
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONNECTIONS)
+
+        async with AsyncClient(**self._client_options()) as client:
+
+            async def put_status(ticket_id: int, status: int) -> None:
+                for attempt in range(_RATE_LIMIT_ATTEMPTS):
+                    async with semaphore:
+                        response = await client.put(
+                            f"{self.base_url}/tickets/{ticket_id}",
+                            content=msgspec.json.encode({"status": status}),
+                        )
+                    if response.status_code != 429 or attempt == _RATE_LIMIT_ATTEMPTS - 1:
+                        break
+                    await asyncio.sleep(_retry_delay(response, attempt))
+                response.raise_for_status()
+
+            results = await asyncio.gather(
+                *(put_status(ticket_id, status) for ticket_id, status in updates),
+                return_exceptions=True,
+            )
+
+        return [result if isinstance(result, BaseException) else None for result in results]
@@ -1,18 +1,50 @@
 """Configuration management for the Freshservice CLI."""
 
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+_LOADED = False
+
+
+def load_env() -> None:
+    """Load variables from a .env file, at most once per process.
+
+    python-dotenv is imported here rather than at module level so commands
+    that never need configuration do not pay for the import.
+    """
+    global _LOADED
+    if _LOADED:
+        return
+    _LOADED = True
+
+    if "FRESHSERVICE_API_KEY" in os.environ and "FRESHSERVICE_DOMAIN" in os.environ:
+        return
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
 
 
 class Config:
-    """Configuration loader for Freshservice CLI."""
+    """Configuration loader for Freshservice CLI.
 
-    def __init__(self) -> None:
-        """Initialize configuration from environment variables."""
-        self.api_key = os.getenv("FRESHSERVICE_API_KEY")
-        self.domain = os.getenv("FRESHSERVICE_DOMAIN", "freshservice.com")
+    The environment is read once per process; later ``Config()`` calls return
+    the same instance. Use ``load_from_env`` to re-read it explicitly.
+    """
+
+    _cached: "Config | None" = None
+
+    api_key: str | None
+    domain: str
+
+    def __new__(cls) -> "Config":
+        """Return the process-wide configuration, reading the environment on first use."""
+        if cls._cached is None:
+            config = super().__new__(cls)
+            config.load_from_env()
+            cls._cached = config
+        return cls._cached
 
     def load_from_env(self) -> bool:
         """Load configuration from environment variables.
@@ -20,6 +52,7 @@ class Config:
         Returns:
             True if API key is present, False otherwise
         """
+        load_env()
         self.api_key = os.getenv("FRESHSERVICE_API_KEY")
         self.domain = os.getenv("FRESHSERVICE_DOMAIN", "freshservice.com")
         return bool(self.api_key)
@@ -35,3 +68,4 @@ class Config:
         os.environ["FRESHSERVICE_DOMAIN"] = domain
         self.api_key = api_key
         self.domain = domain
+
@@ -0,0 +1,12 @@
+"""Shared fixtures for the fresh-cli tests."""
+
+import pytest
+
+import fresh_cli.config
+
+
+@pytest.fixture(autouse=True)
+def reset_config(monkeypatch):
+    """Give each test a fresh Config and an unread .env, restoring both afterwards."""
+    monkeypatch.setattr(fresh_cli.config.Config, "_cached", None)
+    monkeypatch.setattr(fresh_cli.config, "_LOADED", False)
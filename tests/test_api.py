@@ -0,0 +1,215 @@
+"""Tests for the Freshservice API client."""
+
+import asyncio
+import functools
+from datetime import datetime, timezone
+
+import httpx
+import msgspec
+import pytest
+
+import fresh_cli.api
+from fresh_cli.api import FreshserviceClient, Ticket
+
+
+NEXT_LINK = '<https://example.freshservice.com/api/v2/tickets?page={page}>; rel="next"'
+
+
+def make_client(handler) -> FreshserviceClient:
+    """Build a FreshserviceClient whose requests are served by handler."""
+    client = FreshserviceClient(api_key="key", domain="example.freshservice.com")
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def make_async_client(monkeypatch, handler) -> FreshserviceClient:
+    """Build a FreshserviceClient whose async requests are served by handler."""
+    transport = httpx.MockTransport(handler)
+    client_factory = functools.partial(httpx.AsyncClient, transport=transport)
+    monkeypatch.setattr(fresh_cli.api, "AsyncClient", client_factory)
+    return FreshserviceClient(api_key="key", domain="example.freshservice.com")
+
+
+def ticket_page(first_id: int, count: int) -> list[dict]:
+    return [
+        {"id": first_id + i, "subject": f"Ticket {first_id + i}", "status": 2, "priority": 1}
+        for i in range(count)
+    ]
+
+
+def test_list_tickets_follows_next_link_across_pages():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.url.params["page"])
+        headers = {}
+        if page < 3:
+            headers["Link"] = NEXT_LINK.format(page=page + 1)
+        body = msgspec.json.encode({"tickets": ticket_page(page * 100, 100)})
+        return httpx.Response(200, content=body, headers=headers)
+
+    tickets = make_client(handler).list_tickets(limit=250)
+
+    assert len(tickets) == 250
+    assert [t.id for t in tickets[:2]] == [100, 101]
+    assert tickets[-1].id == 349
+    assert [r.url.params["page"] for r in requests] == ["1", "2", "3"]
+    assert all(r.url.params["per_page"] == "100" for r in requests)
+
+
+def test_list_tickets_stops_fetching_once_limit_is_reached():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.url.params["page"])
+        headers = {"Link": NEXT_LINK.format(page=page + 1)}
+        per_page = int(request.url.params["per_page"])
+        body = msgspec.json.encode({"tickets": ticket_page(page * 100, per_page)})
+        return httpx.Response(200, content=body, headers=headers)
+
+    tickets = make_client(handler).list_tickets_summary(limit=5)
+
+    assert [t.id for t in tickets] == [100, 101, 102, 103, 104]
+    assert len(requests) == 1
+    assert requests[0].url.params["per_page"] == "5"
+
+
+def test_list_tickets_sends_filters_as_filter_query():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=msgspec.json.encode({"tickets": []}))
+
+    make_client(handler).list_tickets(filters={"status": 2, "priority": 3}, limit=10)
+
+    (request,) = requests
+    assert request.url.path == "/api/v2/tickets/filter"
+    assert request.url.params["query"] == '"status:2 AND priority:3"'
+
+
+def test_list_tickets_sends_order_type_to_tickets_endpoint():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=msgspec.json.encode({"tickets": []}))
+
+    make_client(handler).list_tickets(limit=10, order_type="asc")
+
+    (request,) = requests
+    assert request.url.path == "/api/v2/tickets"
+    assert request.url.params["order_type"] == "asc"
+
+
+def test_list_tickets_rejects_order_type_with_filters():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request should be sent")
+
+    with pytest.raises(ValueError, match="order_type"):
+        make_client(handler).list_tickets(filters={"status": 2}, order_type="asc")
+
+
+def test_ticket_timestamps_parse_api_format():
+    ticket = Ticket(id=1, created_at="2024-03-05T10:15:30Z", updated_at="")
+
+    assert ticket.created == datetime(2024, 3, 5, 10, 15, 30, tzinfo=timezone.utc)
+    assert ticket.updated is None
+
+
+def test_update_ticket_statuses_reports_failures_per_ticket(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        ticket_id = int(request.url.path.rsplit("/", 1)[1])
+        if ticket_id == 2:
+            return httpx.Response(404)
+        if ticket_id == 3:
+            raise asyncio.CancelledError
+        assert msgspec.json.decode(request.content) == {"status": 4}
+        return httpx.Response(200)
+
+    client = make_async_client(monkeypatch, handler)
+
+    errors = asyncio.run(client.update_ticket_statuses([(1, 4), (2, 4), (3, 4)]))
+
+    assert errors[0] is None
+    assert isinstance(errors[1], httpx.HTTPStatusError)
+    assert isinstance(errors[2], asyncio.CancelledError)
+
+
+def test_update_ticket_statuses_caps_requests_in_flight(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    monkeypatch.setattr(fresh_cli.api, "_MAX_CONNECTIONS", 2)
+    client = make_async_client(monkeypatch, handler)
+
+    errors = asyncio.run(client.update_ticket_statuses([(i, 4) for i in range(6)]))
+
+    assert errors == [None] * 6
+    assert peak == 2
+
+
+def test_update_ticket_statuses_retries_rate_limited_requests(monkeypatch):
+    attempts: dict[int, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ticket_id = int(request.url.path.rsplit("/", 1)[1])
+        attempts[ticket_id] = attempts.get(ticket_id, 0) + 1
+        # Ticket 1 is rate limited once, ticket 2 on every attempt.
+        if ticket_id == 2 or attempts[ticket_id] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200)
+
+    client = make_async_client(monkeypatch, handler)
+
+    errors = asyncio.run(client.update_ticket_statuses([(1, 4), (2, 4)]))
+
+    assert errors[0] is None
+    assert isinstance(errors[1], httpx.HTTPStatusError)
+    assert errors[1].response.status_code == 429
+    assert attempts == {1: 2, 2: 3}
+
+
+NULL_TICKET = {
+    "id": 5,
+    "subject": None,
+    "description": None,
+    "status": None,
+    "priority": None,
+    "created_at": None,
+    "updated_at": None,
+    "requester_id": None,
+    "responder_id": None,
+}
+
+
+def test_get_ticket_accepts_null_fields():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=msgspec.json.encode({"ticket": NULL_TICKET}))
+
+    ticket = make_client(handler).get_ticket(5)
+
+    assert ticket == Ticket(id=5)
+    assert ticket.description is None
+    assert ticket.created is None
+
+
+def test_list_tickets_accepts_null_fields():
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = msgspec.json.encode({"tickets": [NULL_TICKET, *ticket_page(6, 1)]})
+        return httpx.Response(200, content=body)
+
+    client = make_client(handler)
+
+    assert [t.id for t in client.list_tickets()] == [5, 6]
+    assert [t.subject for t in client.list_tickets_summary()] == [None, "Ticket 6"]
@@ -0,0 +1,111 @@
+"""Tests for the fresh-cli command-line interface."""
+
+import functools
+
+import httpx
+import msgspec
+import pytest
+from click.testing import CliRunner
+
+import fresh_cli.api
+from fresh_cli.__main__ import cli
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the CLI's HTTP clients through a MockTransport calling handler."""
+
+    def install(handler):
+        transport = httpx.MockTransport(handler)
+        for name, client_class in (("Client", httpx.Client), ("AsyncClient", httpx.AsyncClient)):
+            client_factory = functools.partial(client_class, transport=transport)
+            monkeypatch.setattr(fresh_cli.api, name, client_factory)
+
+    return install
+
+
+@pytest.mark.parametrize("limit", ["0", "-1"])
+def test_list_rejects_non_positive_limit(limit):
+    result = CliRunner().invoke(cli, ["--api-key", "key", "list", "--limit", limit])
+
+    assert result.exit_code == 2
+    assert "Invalid value for '--limit'" in result.output
+
+
+def test_list_renders_ticket_rows(serve):
+    tickets = [
+        {"id": 7, "subject": "Printer jammed", "status": 2, "priority": 3},
+        {"id": 8, "subject": "x" * 50, "status": 9, "priority": 1},
+    ]
+    serve(lambda request: httpx.Response(200, content=msgspec.json.encode({"tickets": tickets})))
+
+    result = CliRunner().invoke(cli, ["--api-key", "key", "list"])
+
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[2] == f"{7:<10} {'Printer jammed':<40} {'Open':<12} {'High':<10}"
+    assert lines[3] == f"{8:<10} {'x' * 37 + '...':<40} {'9':<12} {'Low':<10}"
+
+
+def test_list_rejects_order_type_with_filters():
+    result = CliRunner().invoke(
+        cli, ["--api-key", "key", "list", "--status", "open", "--order-type", "asc"]
+    )
+
+    assert result.exit_code == 2
+    assert "--order-type cannot be combined" in result.output
+
+
+def test_view_prints_ticket_with_null_fields(serve):
+    ticket = {"id": 5, "subject": None, "description": None, "status": 4, "priority": None}
+    serve(lambda request: httpx.Response(200, content=msgspec.json.encode({"ticket": ticket})))
+
+    result = CliRunner().invoke(cli, ["--api-key", "key", "view", "5"])
+
+    assert result.exit_code == 0
+    assert "Ticket #5" in result.output
+    assert "  Status:    Resolved" in result.output
+    assert "  Priority:  -" in result.output
+    assert "  Created:   -" in result.output
+    assert "  Assignee:  Unassigned" in result.output
+    assert "None" not in result.output
+
+
+def test_list_renders_null_status_and_priority(serve):
+    tickets = [{"id": 9, "subject": None, "status": None, "priority": None}]
+    serve(lambda request: httpx.Response(200, content=msgspec.json.encode({"tickets": tickets})))
+
+    result = CliRunner().invoke(cli, ["--api-key", "key", "list"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines()[2] == f"{9:<10} {'':<40} {'-':<12} {'-':<10}"
+
+
+def test_status_batch_reports_each_ticket(serve):
+    def handler(request: httpx.Request) -> httpx.Response:
+        ticket_id = int(request.url.path.rsplit("/", 1)[1])
+        return httpx.Response(404 if ticket_id == 2 else 200)
+
+    serve(handler)
+
+    args = ["--api-key", "key", "status-batch", "resolved", "1", "2", "3"]
+    result = CliRunner().invoke(cli, args)
+
+    assert result.exit_code == 1
+    assert result.stdout.splitlines() == [
+        "Ticket #1 status updated to resolved.",
+        "Ticket #3 status updated to resolved.",
+    ]
+    assert "Failed to update ticket #2: Client error '404 Not Found'" in result.stderr
+    assert "Error: 1 of 3 ticket updates failed." in result.stderr
+
+
+def test_status_batch_succeeds_when_all_updates_succeed(serve):
+    serve(lambda request: httpx.Response(200))
+
+    result = CliRunner().invoke(cli, ["--api-key", "key", "status-batch", "open", "4", "5"])
+
+    assert result.exit_code == 0
+    assert result.output == (
+        "Ticket #4 status updated to open.\nTicket #5 status updated to open.\n"
+    )
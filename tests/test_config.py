@@ -0,0 +1,57 @@
+"""Tests for configuration loading."""
+
+import dotenv
+import pytest
+
+from fresh_cli.config import Config
+
+
+@pytest.fixture
+def load_dotenv_calls(monkeypatch):
+    """Replace dotenv.load_dotenv with a recorder and return its call list."""
+    calls = []
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda *args, **kwargs: calls.append(args))
+    return calls
+
+
+def test_config_returns_the_same_instance(monkeypatch, load_dotenv_calls):
+    monkeypatch.setenv("FRESHSERVICE_API_KEY", "key")
+    monkeypatch.setenv("FRESHSERVICE_DOMAIN", "example.freshservice.com")
+
+    config = Config()
+    monkeypatch.setenv("FRESHSERVICE_API_KEY", "other")
+
+    assert Config() is config
+    assert Config().api_key == "key"
+
+
+def test_load_from_env_rereads_the_environment(monkeypatch, load_dotenv_calls):
+    monkeypatch.setenv("FRESHSERVICE_API_KEY", "key")
+    monkeypatch.setenv("FRESHSERVICE_DOMAIN", "example.freshservice.com")
+    config = Config()
+
+    monkeypatch.setenv("FRESHSERVICE_API_KEY", "other")
+    monkeypatch.delenv("FRESHSERVICE_DOMAIN")
+
+    assert config.load_from_env() is True
+    assert config.api_key == "other"
+    assert config.domain == "freshservice.com"
+
+
+def test_env_file_is_skipped_when_both_variables_are_set(monkeypatch, load_dotenv_calls):
+    monkeypatch.setenv("FRESHSERVICE_API_KEY", "key")
+    monkeypatch.setenv("FRESHSERVICE_DOMAIN", "example.freshservice.com")
+
+    Config()
+
+    assert load_dotenv_calls == []
+
+
+def test_env_file_is_loaded_when_a_variable_is_missing(monkeypatch, load_dotenv_calls):
+    monkeypatch.setenv("FRESHSERVICE_API_KEY", "key")
+    monkeypatch.delenv("FRESHSERVICE_DOMAIN", raising=False)
+
+    Config()
+    Config().load_from_env()
+
+    assert len(load_dotenv_calls) == 1